@@ -5,9 +5,7 @@ from typing import Any
 from typing import Container
 from typing import Dict
 from typing import Iterable
-from typing import Iterator
 from typing import List
-from typing import Optional
 from typing import overload
 from typing import Sequence
 from typing import Tuple
@@ -37,39 +35,12 @@ def get_replacements(
     ]
 
 
-def find_token(
-    string: bytes, pos: int, tokens: Sequence[bytes]
-) -> Tuple[Optional[bytes], int]:
-    """Find the first occurrence of any of multiple tokens."""
-    pattern = re.compile(b"|".join(re.escape(token) for token in tokens))
-    match = pattern.search(string, pos)
-    if match is None:
-        return None, -1
-    return match.group(), match.start()
-
-
 def quote_tokens(
     text: bytes, quotes: Tuple[bytes, bytes], tokens: Sequence[bytes]
 ) -> bytes:
     """Wrap tokens in ``<quotes[0]><token><quotes[1]>``."""
-
-    def _generate() -> Iterator[bytes]:
-        index = 0
-
-        while index < len(text):
-            token, found = find_token(text, index, tokens)
-
-            if token is None:
-                yield text[index:]
-                break
-
-            if found != 0:
-                yield text[index:found]
-
-            yield token.join(quotes)
-            index = found + len(token)
-
-    return b"".join(_generate())
+    pattern = re.compile(b"|".join(re.escape(token) for token in tokens))
+    return pattern.sub(lambda match: match.group().join(quotes), text)
 
 
 @overload